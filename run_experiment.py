@@ -17,6 +17,12 @@ from agents import AgentFactory
 from tasks import TaskGenerator, TaskValidator
 from utils import ExperimentLogger, ExperimentResult, LLMManager
 
+# Substrings that mark an LLM error as a rate limit; each is searched for in the error text
+_RATE_LIMIT_INDICATORS = (
+    "quota", "rate limit", "too many requests", "429",
+    "exceeded", "per minute", "per hour"
+)
+
 
 class ExperimentRunner:
     """Simple experiment runner with rate limiting enabled by default."""
@@ -339,12 +345,7 @@ Final Answer:
         error_lower = error_message.lower()
         
         # Check for common rate limit indicators
-        rate_limit_indicators = [
-            "quota", "rate limit", "too many requests", "429", 
-            "exceeded", "per minute", "per hour"
-        ]
-        
-        if any(indicator in error_lower for indicator in rate_limit_indicators):
+        if any(indicator in error_lower for indicator in _RATE_LIMIT_INDICATORS):
             # Extract retry delay if available
             if "retry_delay" in error_message and "seconds:" in error_message:
                 try:
@@ -4,16 +4,150 @@ Task validation utilities for checking correctness of outputs using reference-ba
 import re
 import ast
 import os
-from typing import Dict, List, Any, Tuple, Set
+import functools
+import hashlib
+from collections import OrderedDict
+import ahocorasick
+from typing import Dict, List, Any, Tuple, Set, NamedTuple
 from .task_definitions import Task
 
 
+# Required itinerary cities and their bit in ItineraryFeatures.cities_mask
+_CITY_BITS = {'london': 1, 'paris': 2, 'amsterdam': 4, 'berlin': 8}
+_ALL_CITIES_MASK = 0xF
+
+# Single-alternation patterns so each structure check is one scan of the text
+_DAY_RE = re.compile(
+    r'day\s*\d+|day\s+(?:one|two|three|four|five|six|seven)|\d+\s*[–-]\s*\w+'
+    r'|sunday|monday|tuesday|wednesday|thursday|friday|saturday'
+)
+_TIME_RE = re.compile(r'\d{1,2}:\d{2}|\d{1,2}\s*am|\d{1,2}\s*pm|morning|afternoon|evening|night')
+_STEP_RE = re.compile(r'step\s*\d+|\d+\.|\d+\)|###\s*\d+')
+
+# Game of Life survival/birth counts (2 and 3) appearing close together on one line
+_GOL_RULE_RE = re.compile(r'[^0-9]2[^0-9].{0,200}?3[^0-9]|[^0-9]3[^0-9].{0,200}?2[^0-9]')
+
+# Annotated assignments or return annotations
+_TYPE_HINT_RE = re.compile(r':\s*\w+\s*=|:\s*\w+\s*->')
+
+# Outputs shorter than this are scored 0 without running feature extraction
+_MIN_OUTPUT_LENGTH = 30
+
+# Number of (task type, output digest) validation results kept for re-scoring
+_VALIDATION_CACHE_SIZE = 4096
+
+# Bonus points awarded for each assessed detail level
+_DETAIL_LEVEL_POINTS = {'high': 5, 'medium': 3, 'low': 0}
+
+# Keyword groups scanned together in a single pass per extractor
+_ITINERARY_KEYWORDS = {
+    **{city: (city,) for city in _CITY_BITS},
+    'transport': ('train', 'eurostar', 'thalys', 'ice', 'flight', 'rail', 'plane'),
+    'currency': ('$', '€', '£'),
+    'budget': ('cost', 'budget', 'price', 'total', 'usd', 'euro'),
+    'activity': ('museum', 'tour', 'visit', 'see', 'explore', 'walk', 'gallery', 'cathedral', 'palace'),
+    'backup': ('backup', 'fallback', 'alternative', 'rain', 'weather', 'indoor'),
+}
+_PROCEDURE_KEYWORDS = {
+    'sequence': ('first', 'second', 'third', 'next', 'then', 'after', 'before', 'finally'),
+    'verification': ('verify', 'check', 'confirm', 'validate', 'test', 'ensure'),
+    'rollback': ('rollback', 'revert', 'undo', 'restore', 'back out'),
+    'backup': ('backup', 'snapshot', 'copy', 'save', 'dump'),
+    'responsibility': ('responsible', 'owner', 'team', 'role', 'who', 'assign'),
+    'notification': ('notify', 'alert', 'inform', 'communicate', 'announce'),
+    'documentation': ('document', 'record', 'log', 'changelog', 'update'),
+    'tooling': ('ansible', 'docker'),
+    'checkpoint': ('checkpoint', '✅', 'confirm', 'verify'),
+}
+
+
+def _build_keyword_automaton(groups: Dict[str, Tuple[str, ...]]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton mapping each keyword to the groups it belongs to."""
+    automaton = ahocorasick.Automaton()
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, automaton.get(keyword, ()) + (group,))
+    automaton.make_automaton()
+    return automaton
+
+
+_ITINERARY_AUTOMATON = _build_keyword_automaton(_ITINERARY_KEYWORDS)
+_PROCEDURE_AUTOMATON = _build_keyword_automaton(_PROCEDURE_KEYWORDS)
+
+
+def _count_keyword_groups(automaton: ahocorasick.Automaton, text_lower: str) -> Dict[str, int]:
+    """Count keyword occurrences per group in one pass over lowercased text."""
+    counts: Dict[str, int] = {}
+    for _, groups in automaton.iter(text_lower):
+        for group in groups:
+            counts[group] = counts.get(group, 0) + 1
+    return counts
+
+
+class CodeFeatures(NamedTuple):
+    """Structural and semantic features extracted from a code output."""
+    has_main_guard: bool
+    has_grid_class: bool
+    has_step_method: bool
+    has_neighbor_counting: bool
+    has_proper_rules: bool
+    has_display_method: bool
+    has_command_line_args: bool
+    has_type_hints: bool
+    has_docstrings: bool
+    syntactically_valid: bool
+    class_count: int
+    method_count: int
+    line_count: int
+
+
+class ItineraryFeatures(NamedTuple):
+    """Structural and content features extracted from an itinerary output."""
+    has_daily_structure: bool
+    covers_all_cities: bool
+    has_budget_breakdown: bool
+    has_transportation: bool
+    has_specific_times: bool
+    has_activities: bool
+    has_backup_plans: bool
+    has_cost_details: bool
+    cities_mask: int
+    day_count: int
+    word_count: int
+    has_table_format: bool
+    detail_level: str
+
+
+class ProcedureFeatures(NamedTuple):
+    """Structural and content features extracted from a procedure output."""
+    has_numbered_steps: bool
+    has_clear_sequence: bool
+    has_verification_points: bool
+    has_rollback_plan: bool
+    has_responsibilities: bool
+    has_backup_strategy: bool
+    has_notification_step: bool
+    has_documentation_step: bool
+    step_count: int
+    word_count: int
+    has_code_examples: bool
+    has_checkpoints: bool
+    detail_level: str
+
+
 class ReferenceBasedValidator:
     """Validates task outputs against gold standard references with discriminative scoring."""
     
     def __init__(self):
         """Initialize validator and load reference outputs."""
         self._load_references()
+        self._scorers = {
+            'code_generation': self._score_code_against_reference,
+            'itinerary_planning': self._score_itinerary_against_reference,
+            'procedure_structuring': self._score_procedure_against_reference
+        }
+        # LRU of past results keyed by a digest of the output, so large outputs aren't retained
+        self._results_cache: "OrderedDict[Tuple[str, bytes], Tuple[bool, Tuple[str, ...], float]]" = OrderedDict()
     
     def _load_references(self):
         """Load the gold standard reference outputs."""
@@ -40,386 +174,363 @@ class ReferenceBasedValidator:
         except FileNotFoundError:
             self.reference_procedure = ""
     
-    def _extract_code_features(self, code_text: str) -> Dict[str, Any]:
-        """Extract structural and semantic features from code."""
-        features = {
-            'has_main_guard': '__name__ == "__main__"' in code_text,
-            'has_grid_class': False,
-            'has_step_method': False,
-            'has_neighbor_counting': False,
-            'has_proper_rules': False,
-            'has_display_method': False,
-            'has_command_line_args': False,
-            'has_type_hints': False,
-            'has_docstrings': False,
-            'syntactically_valid': False,
-            'class_count': 0,
-            'method_count': 0,
-            'line_count': len(code_text.split('\n'))
-        }
-        
-        # Check syntax validity
-        try:
-            ast.parse(code_text)
-            features['syntactically_valid'] = True
-        except SyntaxError:
-            pass
-        
-        # Analyze AST for deeper features
-        try:
-            tree = ast.parse(code_text)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    features['class_count'] += 1
-                    if 'grid' in node.name.lower():
-                        features['has_grid_class'] = True
-                        # Check methods in Grid class
-                        for item in node.body:
-                            if isinstance(item, ast.FunctionDef):
-                                features['method_count'] += 1
-                                if 'step' in item.name.lower() or 'advance' in item.name.lower():
-                                    features['has_step_method'] = True
-                                if 'neighbor' in item.name.lower() or 'count' in item.name.lower():
-                                    features['has_neighbor_counting'] = True
-                                if 'display' in item.name.lower() or '__str__' in item.name:
-                                    features['has_display_method'] = True
-                elif isinstance(node, ast.FunctionDef):
-                    features['method_count'] += 1
-        except:
-            pass
+    def _extract_code_features(self, code_text: str, parse: bool = True) -> CodeFeatures:
+        """Extract structural and semantic features from code.
+        
+        With parse=False the text is not run through ast.parse and is reported
+        as not syntactically valid.
+        """
+        code_lower = code_text.lower()
+        has_grid_class = False
+        has_step_method = False
+        has_neighbor_counting = False
+        has_proper_rules = False
+        has_display_method = False
+        syntactically_valid = False
+        class_count = 0
+        method_count = 0
+        
+        # Parse once for syntax validity
+        tree = None
+        if parse:
+            try:
+                tree = ast.parse(code_text)
+                syntactically_valid = True
+            except SyntaxError:
+                pass
+        
+        # Analyze AST for deeper features. Classes and methods only live in module and
+        # class bodies, so walk those instead of visiting every expression node.
+        if tree is not None:
+            pending = [tree.body]
+            while pending:
+                for node in pending.pop():
+                    if isinstance(node, ast.ClassDef):
+                        class_count += 1
+                        if 'grid' in node.name.lower():
+                            has_grid_class = True
+                            # Check methods in Grid class
+                            for item in node.body:
+                                if isinstance(item, ast.FunctionDef):
+                                    method_count += 1
+                                    name = item.name.lower()
+                                    if 'step' in name or 'advance' in name:
+                                        has_step_method = True
+                                    if 'neighbor' in name or 'count' in name:
+                                        has_neighbor_counting = True
+                                    if 'display' in name or '__str__' in name:
+                                        has_display_method = True
+                        pending.append(node.body)
+                    elif isinstance(node, ast.FunctionDef):
+                        method_count += 1
         
         # Check for Game of Life rules (2,3 survival, 3 birth)
-        if re.search(r'[^0-9]2[^0-9].*3[^0-9]|[^0-9]3[^0-9].*2[^0-9]', code_text):
-            if 'neighbor' in code_text.lower() and ('live' in code_text.lower() or 'alive' in code_text.lower()):
-                features['has_proper_rules'] = True
-        
-        # Check for advanced features
-        features['has_command_line_args'] = 'argparse' in code_text or 'ArgumentParser' in code_text
-        features['has_type_hints'] = bool(re.search(r':\s*\w+\s*=|:\s*\w+\s*->', code_text))
-        features['has_docstrings'] = '"""' in code_text or "'''" in code_text
-        
-        return features
+        # Cheap substring checks first so the regex only runs on plausible candidates
+        if ('2' in code_text and '3' in code_text and 'neighbor' in code_lower
+                and ('live' in code_lower or 'alive' in code_lower)):
+            has_proper_rules = _GOL_RULE_RE.search(code_text) is not None
+        
+        return CodeFeatures(
+            has_main_guard='__name__ == "__main__"' in code_text,
+            has_grid_class=has_grid_class,
+            has_step_method=has_step_method,
+            has_neighbor_counting=has_neighbor_counting,
+            has_proper_rules=has_proper_rules,
+            has_display_method=has_display_method,
+            # Check for advanced features
+            has_command_line_args='argparse' in code_text or 'ArgumentParser' in code_text,
+            has_type_hints=_TYPE_HINT_RE.search(code_text) is not None,
+            has_docstrings='"""' in code_text or "'''" in code_text,
+            syntactically_valid=syntactically_valid,
+            class_count=class_count,
+            method_count=method_count,
+            line_count=len(code_text.split('\n'))
+        )
     
     def _score_code_against_reference(self, output: str) -> Tuple[float, List[str]]:
         """Score code output against the reference implementation."""
+        if len(output) < _MIN_OUTPUT_LENGTH:
+            return 0.0, ["Response empty or too brief"]
+        
         issues = []
-        scores = {}
+        total = 0
         
         # Extract code from output (handle both raw code and markdown code blocks)
-        code_blocks = re.findall(r'```python\n(.*?)\n```', output, re.DOTALL)
-        if code_blocks:
-            code_text = code_blocks[0]
-        else:
+        # Only the first fenced block is used, so partition instead of scanning for all of them
+        _, fence, rest = output.partition('```python\n')
+        code_text, closing_fence, _ = rest.partition('\n```')
+        fenced = bool(fence and closing_fence)
+        if not fenced:
             # Try to extract the main code part
             code_text = output
         
-        features = self._extract_code_features(code_text)
-        ref_features = self._extract_code_features(self.reference_code)
+        # Unfenced text without any def/class cannot hold the expected implementation,
+        # so it is not parsed at all
+        has_definitions = fenced or 'def ' in code_text or 'class ' in code_text
+        features = self._extract_code_features(code_text, parse=has_definitions)
         
         # Core functionality scoring (60 points total)
-        scores['syntax'] = 15 if features['syntactically_valid'] else 0
-        if not features['syntactically_valid']:
-            issues.append("Code contains syntax errors")
-        
-        scores['grid_class'] = 15 if features['has_grid_class'] else 0
-        if not features['has_grid_class']:
+        total += 15 if features.syntactically_valid else 0
+        if not features.syntactically_valid:
+            if has_definitions:
+                issues.append("Code contains syntax errors")
+            else:
+                issues.append("No function or class definitions found")
+        
+        total += 15 if features.has_grid_class else 0
+        if not features.has_grid_class:
             issues.append("Missing Grid class implementation")
         
-        scores['game_rules'] = 15 if features['has_proper_rules'] else 0
-        if not features['has_proper_rules']:
+        total += 15 if features.has_proper_rules else 0
+        if not features.has_proper_rules:
             issues.append("Game of Life rules not properly implemented")
         
-        scores['neighbor_logic'] = 15 if features['has_neighbor_counting'] else 0
-        if not features['has_neighbor_counting']:
+        total += 15 if features.has_neighbor_counting else 0
+        if not features.has_neighbor_counting:
             issues.append("Missing neighbor counting functionality")
         
         # Structure and completeness (25 points total)
-        scores['main_guard'] = 10 if features['has_main_guard'] else 0
-        if not features['has_main_guard']:
+        total += 10 if features.has_main_guard else 0
+        if not features.has_main_guard:
             issues.append("Missing if __name__ == '__main__' guard")
         
-        scores['step_method'] = 10 if features['has_step_method'] else 0
-        if not features['has_step_method']:
+        total += 10 if features.has_step_method else 0
+        if not features.has_step_method:
             issues.append("Missing step/advance method")
         
-        scores['display'] = 5 if features['has_display_method'] else 0
-        if not features['has_display_method']:
+        total += 5 if features.has_display_method else 0
+        if not features.has_display_method:
             issues.append("Missing display functionality")
         
         # Code quality and sophistication (15 points total)
-        scores['command_args'] = 5 if features['has_command_line_args'] else 0
-        scores['type_hints'] = 5 if features['has_type_hints'] else 0  
-        scores['documentation'] = 5 if features['has_docstrings'] else 0
+        total += 5 if features.has_command_line_args else 0
+        total += 5 if features.has_type_hints else 0  
+        total += 5 if features.has_docstrings else 0
         
         # Penalty for being too short (realistic implementation should be substantial)
-        if features['line_count'] < 50:
-            scores['length_penalty'] = -10
+        if features.line_count < 50:
+            total -= 10
             issues.append("Implementation too brief for a complete solution")
-        else:
-            scores['length_penalty'] = 0
         
-        total_score = sum(scores.values())
-        return max(0, min(100, total_score)), issues
+        return max(0, min(100, total)), issues
     
     
-    def _extract_itinerary_features(self, text: str) -> Dict[str, Any]:
+    def _extract_itinerary_features(self, text: str) -> ItineraryFeatures:
         """Extract structural and content features from itinerary."""
-        features = {
-            'has_daily_structure': False,
-            'covers_all_cities': False,
-            'has_budget_breakdown': False,
-            'has_transportation': False,
-            'has_specific_times': False,
-            'has_activities': False,
-            'has_backup_plans': False,
-            'has_cost_details': False,
-            'cities_mentioned': set(),
-            'day_count': 0,
-            'word_count': len(text.split()),
-            'has_table_format': False,
-            'detail_level': 'low'
-        }
-        
+        word_count = len(text.split())
         text_lower = text.lower()
+        keyword_counts = _count_keyword_groups(_ITINERARY_AUTOMATON, text_lower)
         
         # Check for daily structure
-        day_patterns = [r'day\s*\d+', r'day\s+one|two|three|four|five|six|seven', 
-                       r'\d+\s*[–-]\s*\w+', r'sunday|monday|tuesday|wednesday|thursday|friday|saturday']
-        features['day_count'] = sum(len(re.findall(pattern, text_lower)) for pattern in day_patterns)
-        features['has_daily_structure'] = features['day_count'] >= 6
+        day_count = sum(1 for _ in _DAY_RE.finditer(text_lower))
         
         # Check cities
-        required_cities = ['london', 'paris', 'amsterdam', 'berlin']
-        for city in required_cities:
-            if city in text_lower:
-                features['cities_mentioned'].add(city)
-        features['covers_all_cities'] = len(features['cities_mentioned']) == len(required_cities)
-        
-        # Transportation indicators
-        transport_terms = ['train', 'eurostar', 'thalys', 'ice', 'flight', 'rail', 'plane']
-        features['has_transportation'] = any(term in text_lower for term in transport_terms)
-        
-        # Time specifications
-        time_patterns = [r'\d{1,2}:\d{2}', r'\d{1,2}\s*am|\d{1,2}\s*pm', 
-                        r'morning|afternoon|evening|night']
-        features['has_specific_times'] = any(re.search(pattern, text_lower) for pattern in time_patterns)
-        
-        # Budget and cost tracking
-        budget_indicators = ['$', '€', '£', 'cost', 'budget', 'price', 'total', 'usd', 'euro']
-        features['has_budget_breakdown'] = any(indicator in text_lower for indicator in budget_indicators)
-        cost_counts = sum(text_lower.count(indicator) for indicator in ['$', '€', '£'])
-        features['has_cost_details'] = cost_counts >= 10
-        
-        # Activities and attractions
-        activity_terms = ['museum', 'tour', 'visit', 'see', 'explore', 'walk', 'gallery', 'cathedral', 'palace']
-        features['has_activities'] = sum(text_lower.count(term) for term in activity_terms) >= 8
-        
-        # Backup plans
-        backup_indicators = ['backup', 'fallback', 'alternative', 'rain', 'weather', 'indoor']
-        features['has_backup_plans'] = any(indicator in text_lower for indicator in backup_indicators)
+        cities_mask = 0
+        for city, bit in _CITY_BITS.items():
+            if city in keyword_counts:
+                cities_mask |= bit
         
         # Format sophistication
-        features['has_table_format'] = '|' in text and ('---' in text or '====' in text)
+        has_table_format = '|' in text and ('---' in text or '====' in text)
         
         # Detail level assessment
-        if features['word_count'] > 800 and features['has_table_format']:
-            features['detail_level'] = 'high'
-        elif features['word_count'] > 400:
-            features['detail_level'] = 'medium'
-        
-        return features
+        if word_count > 800 and has_table_format:
+            detail_level = 'high'
+        elif word_count > 400:
+            detail_level = 'medium'
+        else:
+            detail_level = 'low'
+        
+        return ItineraryFeatures(
+            has_daily_structure=day_count >= 6,
+            covers_all_cities=cities_mask == _ALL_CITIES_MASK,
+            # Budget and cost tracking
+            has_budget_breakdown='currency' in keyword_counts or 'budget' in keyword_counts,
+            has_transportation='transport' in keyword_counts,
+            # Time specifications
+            has_specific_times=_TIME_RE.search(text_lower) is not None,
+            # Activities and attractions
+            has_activities=keyword_counts.get('activity', 0) >= 8,
+            has_backup_plans='backup' in keyword_counts,
+            has_cost_details=keyword_counts.get('currency', 0) >= 10,
+            cities_mask=cities_mask,
+            day_count=day_count,
+            word_count=word_count,
+            has_table_format=has_table_format,
+            detail_level=detail_level
+        )
     
     def _score_itinerary_against_reference(self, output: str) -> Tuple[float, List[str]]:
         """Score itinerary output against the reference implementation."""
+        if len(output) < _MIN_OUTPUT_LENGTH:
+            return 0.0, ["Response empty or too brief"]
+        
         issues = []
-        scores = {}
+        total = 0
         
         features = self._extract_itinerary_features(output)
-        ref_features = self._extract_itinerary_features(self.reference_itinerary)
         
         # Core requirements (50 points total)
-        scores['city_coverage'] = 15 if features['covers_all_cities'] else len(features['cities_mentioned']) * 3
-        if not features['covers_all_cities']:
-            missing = {'london', 'paris', 'amsterdam', 'berlin'} - features['cities_mentioned']
-            issues.append(f"Missing required cities: {list(missing)}")
+        total += 15 if features.covers_all_cities else features.cities_mask.bit_count() * 3
+        if not features.covers_all_cities:
+            missing = [city for city, bit in _CITY_BITS.items() if not features.cities_mask & bit]
+            issues.append(f"Missing required cities: {missing}")
         
-        scores['daily_structure'] = 15 if features['has_daily_structure'] else min(features['day_count'] * 2, 10)
-        if not features['has_daily_structure']:
+        total += 15 if features.has_daily_structure else min(features.day_count * 2, 10)
+        if not features.has_daily_structure:
             issues.append("Missing proper 7-day structure")
         
-        scores['budget_compliance'] = 10 if features['has_budget_breakdown'] else 0
-        if not features['has_budget_breakdown']:
+        total += 10 if features.has_budget_breakdown else 0
+        if not features.has_budget_breakdown:
             issues.append("Missing budget breakdown or cost information")
         
-        scores['transportation'] = 10 if features['has_transportation'] else 0
-        if not features['has_transportation']:
+        total += 10 if features.has_transportation else 0
+        if not features.has_transportation:
             issues.append("Missing transportation details")
         
         # Detail and sophistication (30 points total)
-        scores['time_specificity'] = 10 if features['has_specific_times'] else 0
-        if not features['has_specific_times']:
+        total += 10 if features.has_specific_times else 0
+        if not features.has_specific_times:
             issues.append("Missing specific times and scheduling")
         
-        scores['activities'] = 10 if features['has_activities'] else 0
-        if not features['has_activities']:
+        total += 10 if features.has_activities else 0
+        if not features.has_activities:
             issues.append("Insufficient activity details")
         
-        scores['cost_detail'] = 10 if features['has_cost_details'] else 0
-        if not features['has_cost_details']:
+        total += 10 if features.has_cost_details else 0
+        if not features.has_cost_details:
             issues.append("Missing detailed cost breakdown")
         
         # Advanced features (20 points total)
-        scores['backup_plans'] = 10 if features['has_backup_plans'] else 0
-        scores['table_format'] = 5 if features['has_table_format'] else 0
-        scores['detail_level'] = {'high': 5, 'medium': 3, 'low': 0}[features['detail_level']]
+        total += 10 if features.has_backup_plans else 0
+        total += 5 if features.has_table_format else 0
+        total += _DETAIL_LEVEL_POINTS[features.detail_level]
         
         # Length penalty for insufficient detail
-        if features['word_count'] < 300:
-            scores['length_penalty'] = -15
+        if features.word_count < 300:
+            total -= 15
             issues.append("Response too brief for a complete 7-day itinerary")
-        else:
-            scores['length_penalty'] = 0
         
-        total_score = sum(scores.values())
-        return max(0, min(100, total_score)), issues
+        return max(0, min(100, total)), issues
     
-    def _extract_procedure_features(self, text: str) -> Dict[str, Any]:
+    def _extract_procedure_features(self, text: str) -> ProcedureFeatures:
         """Extract structural and content features from procedure."""
-        features = {
-            'has_numbered_steps': False,
-            'has_clear_sequence': False,
-            'has_verification_points': False,
-            'has_rollback_plan': False,
-            'has_responsibilities': False,
-            'has_backup_strategy': False,
-            'has_notification_step': False,
-            'has_documentation_step': False,
-            'step_count': 0,
-            'word_count': len(text.split()),
-            'has_code_examples': False,
-            'has_checkpoints': False,
-            'detail_level': 'low'
-        }
-        
+        word_count = len(text.split())
         text_lower = text.lower()
+        keyword_counts = _count_keyword_groups(_PROCEDURE_AUTOMATON, text_lower)
         
         # Step structure analysis
-        step_patterns = [r'step\s*\d+', r'\d+\.', r'\d+\)', r'###\s*\d+']
-        step_matches = []
-        for pattern in step_patterns:
-            step_matches.extend(re.findall(pattern, text_lower))
-        features['step_count'] = len(step_matches)
-        features['has_numbered_steps'] = features['step_count'] >= 8
-        
-        # Sequential flow indicators
-        sequence_words = ['first', 'second', 'third', 'next', 'then', 'after', 'before', 'finally']
-        features['has_clear_sequence'] = sum(text_lower.count(word) for word in sequence_words) >= 5
-        
-        # Verification and validation
-        verification_terms = ['verify', 'check', 'confirm', 'validate', 'test', 'ensure']
-        features['has_verification_points'] = sum(text_lower.count(term) for term in verification_terms) >= 3
-        
-        # Error handling and rollback
-        rollback_terms = ['rollback', 'revert', 'undo', 'restore', 'back out']
-        features['has_rollback_plan'] = any(term in text_lower for term in rollback_terms)
-        
-        # Backup and safety
-        backup_terms = ['backup', 'snapshot', 'copy', 'save', 'dump']
-        features['has_backup_strategy'] = any(term in text_lower for term in backup_terms)
-        
-        # Communication and responsibilities
-        responsibility_terms = ['responsible', 'owner', 'team', 'role', 'who', 'assign']
-        features['has_responsibilities'] = any(term in text_lower for term in responsibility_terms)
-        
-        notification_terms = ['notify', 'alert', 'inform', 'communicate', 'announce']
-        features['has_notification_step'] = any(term in text_lower for term in notification_terms)
-        
-        documentation_terms = ['document', 'record', 'log', 'changelog', 'update']
-        features['has_documentation_step'] = any(term in text_lower for term in documentation_terms)
+        step_count = sum(1 for _ in _STEP_RE.finditer(text_lower))
         
         # Technical sophistication
-        features['has_code_examples'] = '```' in text or 'ansible' in text_lower or 'docker' in text_lower
-        
-        # Checkpoints and validation
-        checkpoint_indicators = ['checkpoint', '✅', 'confirm', 'verify']
-        features['has_checkpoints'] = any(indicator in text_lower for indicator in checkpoint_indicators)
+        has_code_examples = '```' in text or 'tooling' in keyword_counts
         
         # Detail level assessment
-        if features['word_count'] > 600 and features['has_code_examples']:
-            features['detail_level'] = 'high'
-        elif features['word_count'] > 300:
-            features['detail_level'] = 'medium'
-        
-        return features
+        if word_count > 600 and has_code_examples:
+            detail_level = 'high'
+        elif word_count > 300:
+            detail_level = 'medium'
+        else:
+            detail_level = 'low'
+        
+        return ProcedureFeatures(
+            has_numbered_steps=step_count >= 8,
+            # Sequential flow indicators
+            has_clear_sequence=keyword_counts.get('sequence', 0) >= 5,
+            # Verification and validation
+            has_verification_points=keyword_counts.get('verification', 0) >= 3,
+            # Error handling, backup and safety
+            has_rollback_plan='rollback' in keyword_counts,
+            has_responsibilities='responsibility' in keyword_counts,
+            has_backup_strategy='backup' in keyword_counts,
+            # Communication and documentation
+            has_notification_step='notification' in keyword_counts,
+            has_documentation_step='documentation' in keyword_counts,
+            step_count=step_count,
+            word_count=word_count,
+            has_code_examples=has_code_examples,
+            # Checkpoints and validation
+            has_checkpoints='checkpoint' in keyword_counts,
+            detail_level=detail_level
+        )
     
     def _score_procedure_against_reference(self, output: str) -> Tuple[float, List[str]]:
         """Score procedure output against the reference implementation."""
+        if len(output) < _MIN_OUTPUT_LENGTH:
+            return 0.0, ["Response empty or too brief"]
+        
         issues = []
-        scores = {}
+        total = 0
         
         features = self._extract_procedure_features(output)
-        ref_features = self._extract_procedure_features(self.reference_procedure)
         
         # Core structure (40 points total)
-        scores['step_structure'] = 15 if features['has_numbered_steps'] else min(features['step_count'] * 1.5, 10)
-        if not features['has_numbered_steps']:
+        total += 15 if features.has_numbered_steps else min(features.step_count * 1.5, 10)
+        if not features.has_numbered_steps:
             issues.append("Missing clear numbered step structure")
         
-        scores['sequence_flow'] = 10 if features['has_clear_sequence'] else 0
-        if not features['has_clear_sequence']:
+        total += 10 if features.has_clear_sequence else 0
+        if not features.has_clear_sequence:
             issues.append("Missing clear sequential flow indicators")
         
-        scores['verification'] = 15 if features['has_verification_points'] else 0
-        if not features['has_verification_points']:
+        total += 15 if features.has_verification_points else 0
+        if not features.has_verification_points:
             issues.append("Missing verification and validation steps")
         
         # Safety and error handling (30 points total)
-        scores['backup_strategy'] = 10 if features['has_backup_strategy'] else 0
-        if not features['has_backup_strategy']:
+        total += 10 if features.has_backup_strategy else 0
+        if not features.has_backup_strategy:
             issues.append("Missing backup strategy")
         
-        scores['rollback_plan'] = 15 if features['has_rollback_plan'] else 0
-        if not features['has_rollback_plan']:
+        total += 15 if features.has_rollback_plan else 0
+        if not features.has_rollback_plan:
             issues.append("Missing rollback/recovery plan")
         
-        scores['checkpoints'] = 5 if features['has_checkpoints'] else 0
+        total += 5 if features.has_checkpoints else 0
         
         # Communication and governance (20 points total)
-        scores['responsibilities'] = 5 if features['has_responsibilities'] else 0
-        scores['notification'] = 10 if features['has_notification_step'] else 0
-        if not features['has_notification_step']:
+        total += 5 if features.has_responsibilities else 0
+        total += 10 if features.has_notification_step else 0
+        if not features.has_notification_step:
             issues.append("Missing team notification step")
         
-        scores['documentation'] = 5 if features['has_documentation_step'] else 0
+        total += 5 if features.has_documentation_step else 0
         
         # Technical sophistication (10 points total)
-        scores['code_examples'] = 5 if features['has_code_examples'] else 0
-        scores['detail_level'] = {'high': 5, 'medium': 3, 'low': 0}[features['detail_level']]
+        total += 5 if features.has_code_examples else 0
+        total += _DETAIL_LEVEL_POINTS[features.detail_level]
         
         # Length penalty for insufficient detail
-        if features['word_count'] < 200:
-            scores['length_penalty'] = -15
+        if features.word_count < 200:
+            total -= 15
             issues.append("Response too brief for a complete deployment procedure")
-        else:
-            scores['length_penalty'] = 0
         
-        total_score = sum(scores.values())
-        return max(0, min(100, total_score)), issues
+        return max(0, min(100, total)), issues
     
     
     def validate_task_output(self, task: Task, output: str) -> Tuple[bool, List[str], float]:
         """Validate task output based on task type using reference-based scoring."""
-        if task.task_type == "code_generation":
-            score, issues = self._score_code_against_reference(output)
-        elif task.task_type == "itinerary_planning":
-            score, issues = self._score_itinerary_against_reference(output)
-        elif task.task_type == "procedure_structuring":
-            score, issues = self._score_procedure_against_reference(output)
-        else:
+        scorer = self._scorers.get(task.task_type)
+        if scorer is None:
             return False, ["Unknown task type"], 0.0
         
+        # Scoring depends only on the task type and output, so repeated outputs are served from cache
+        key = (task.task_type,
+               hashlib.blake2b(output.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        cached = self._results_cache.get(key)
+        if cached is not None:
+            self._results_cache.move_to_end(key)
+            is_valid, issues, score = cached
+            return is_valid, list(issues), score
+        
+        score, issues = scorer(output)
+        
         # More stringent pass threshold - only truly good outputs should pass
         is_valid = score >= 70  # Raised from 50 to make scoring more discriminative
+        
+        self._results_cache[key] = (is_valid, tuple(issues), score)
+        if len(self._results_cache) > _VALIDATION_CACHE_SIZE:
+            self._results_cache.popitem(last=False)
         return is_valid, issues, score
     
     @staticmethod
@@ -428,20 +539,28 @@ class ReferenceBasedValidator:
         if len(output) <= max_length:
             return output
         
-        # Try to find a natural break point
-        truncated = output[:max_length]
-        last_sentence = truncated.rfind('.')
-        last_newline = truncated.rfind('\n')
+        # Try to find a natural break point (search in place rather than on a sliced copy)
+        last_sentence = output.rfind('.', 0, max_length)
+        last_newline = output.rfind('\n', 0, max_length)
         
-        break_point = max(last_sentence, last_newline)
-        if break_point > max_length * 0.7:  # If break point is reasonably close to end
+        break_point = last_sentence if last_sentence > last_newline else last_newline
+        if break_point > int(max_length * 0.7):  # If break point is reasonably close to end
             return output[:break_point + 1] + "..."
         else:
-            return truncated + "..."
+            return output[:max_length] + "..."
+
+
+@functools.cache
+def _get_validator() -> ReferenceBasedValidator:
+    """Return the shared validator, loading the references on first use."""
+    return ReferenceBasedValidator()
 
 
-# Create a singleton instance for backward compatibility
-task_validator = ReferenceBasedValidator()
+def __getattr__(name: str) -> Any:
+    """Create the ``task_validator`` singleton lazily for backward compatibility."""
+    if name == 'task_validator':
+        return _get_validator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class TaskValidator:
@@ -450,7 +569,7 @@ class TaskValidator:
     @staticmethod
     def validate_task_output(task: Task, output: str) -> Tuple[bool, List[str], float]:
         """Validate task output - delegates to reference-based validator."""
-        return task_validator.validate_task_output(task, output)
+        return _get_validator().validate_task_output(task, output)
     
     @staticmethod
     def format_output_preview(output: str, max_length: int = 200) -> str:
@@ -1,12 +1,29 @@
 """
 Utilities package for logging, LLM management, and other helper functions.
+
+Exports are imported on first access (PEP 562), so importing the package
+does not pull in pandas or langchain until they are actually needed.
 """
+import importlib
 
-from .logging_utils import ExperimentLogger, ExperimentResult
-from .llm_utils import LLMManager
+_LAZY_EXPORTS = {
+    'ExperimentLogger': '.logging_utils',
+    'ExperimentResult': '.logging_utils',
+    'LLMManager': '.llm_utils',
+}
 
 __all__ = [
     'ExperimentLogger',
     'ExperimentResult', 
     'LLMManager'
 ]
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
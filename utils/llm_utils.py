@@ -2,25 +2,37 @@
 LLM configuration and wrapper utilities.
 """
 import os
-from typing import Optional, Dict, Any
-from langchain.llms.base import LLM
-from langchain_google_genai import GoogleGenerativeAI
-from dotenv import load_dotenv
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain.llms.base import LLM
 
 
 class LLMManager:
     """Manages LLM initialization and configuration."""
     
+    # Whether .env has been loaded into the environment (done once, on first use)
+    _env_loaded = False
+    
     def __init__(self):
-        load_dotenv()
         self.available_models = {
             'gemini-2.0-flash-lite': self._create_gemini,
             'gemini-2.0-flash': self._create_gemini,
             'gemini-2.5-flash': self._create_gemini
         }
     
-    def _create_gemini(self, model_name: str, **kwargs) -> LLM:
+    @classmethod
+    def _ensure_env_loaded(cls):
+        """Load variables from .env the first time they are needed."""
+        if not cls._env_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            cls._env_loaded = True
+    
+    def _create_gemini(self, model_name: str, **kwargs) -> "LLM":
         """Create Google Gemini model."""
+        from langchain_google_genai import GoogleGenerativeAI
+        
         api_key = os.getenv('GOOGLE_API_KEY')
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment variables")
@@ -32,8 +44,9 @@ class LLMManager:
             max_output_tokens=kwargs.get('max_tokens', 4096)
         )
     
-    def create_llm(self, model_name: str, **kwargs) -> LLM:
+    def create_llm(self, model_name: str, **kwargs) -> "LLM":
         """Create an LLM instance."""
+        self._ensure_env_loaded()
         if model_name not in self.available_models:
             raise ValueError(f"Model {model_name} not supported. Available: {list(self.available_models.keys())}")
         
@@ -43,9 +56,10 @@ class LLMManager:
         """Get list of available models."""
         return list(self.available_models.keys())
     
-    @staticmethod
-    def get_default_config() -> Dict[str, Any]:
+    @classmethod
+    def get_default_config(cls) -> Dict[str, Any]:
         """Get default LLM configuration from environment."""
+        cls._ensure_env_loaded()
         return {
             'model_name': os.getenv('DEFAULT_MODEL'),
             'temperature': float(os.getenv('TEMPERATURE', 0.3)),
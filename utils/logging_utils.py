@@ -1,17 +1,21 @@
 """
 Logging utilities for experiment tracking and result analysis.
 """
-import json
 import csv
 import logging
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from collections import defaultdict
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-import pandas as pd
+from dataclasses import dataclass, fields
+import orjson
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExperimentResult:
     """Single experiment result."""
     timestamp: str
@@ -32,6 +36,33 @@ class ExperimentResult:
     error_message: Optional[str] = None
 
 
+# Numeric fields averaged in the summary statistics
+_SUMMARY_FIELDS = ('success', 'validation_score', 'execution_time', 'tokens_used', 'reasoning_steps')
+
+# List-valued fields left out of the flat CSV summary
+_CSV_EXCLUDED_FIELDS = ('intermediate_steps', 'validation_issues')
+
+
+def _new_totals() -> Dict[str, float]:
+    """Create an empty running-sum bucket for summary statistics."""
+    return dict.fromkeys(('count',) + _SUMMARY_FIELDS, 0)
+
+
+def _averages(totals: Dict[str, float]) -> Dict[str, float]:
+    """Turn a running-sum bucket into per-field means."""
+    count = totals['count']
+    return {field: totals[field] / count for field in _SUMMARY_FIELDS}
+
+
+def _shutdown_logging(logger: logging.Logger, handlers: tuple, listener: QueueListener):
+    """Detach a logger's handlers, drain its queued records and close the handlers."""
+    for handler in handlers:
+        logger.removeHandler(handler)
+    listener.stop()
+    for handler in handlers + listener.handlers:
+        handler.close()
+
+
 class ExperimentLogger:
     """Handles logging and storage of experiment results."""
     
@@ -52,33 +83,58 @@ class ExperimentLogger:
         log_file = self.results_dir / f"experiment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
         
-        # Console handler
+        # Console handler, kept synchronous so its lines stay in order with print() output
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
         self.logger.addHandler(console_handler)
         
+        # Hand file records to a background thread so disk writes don't block the run
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        self.logger.addHandler(queue_handler)
+        log_listener = QueueListener(log_queue, file_handler)
+        log_listener.start()
+        # Runs on close(), when the logger is collected, or at interpreter exit; it holds no
+        # reference to self, so the logger and its results aren't kept alive until exit
+        self._shutdown_logging = weakref.finalize(
+            self, _shutdown_logging, self.logger, (console_handler, queue_handler), log_listener
+        )
+        
         # Results storage
         self.results: List[ExperimentResult] = []
         
+        # Running sums updated in log_result, so summaries don't rebuild a DataFrame
+        self._overall_totals = _new_totals()
+        self._framework_totals: Dict[str, Dict[str, float]] = defaultdict(_new_totals)
+        self._task_type_totals: Dict[str, Dict[str, float]] = defaultdict(_new_totals)
+        
+    def close(self):
+        """Flush queued log records and stop the background log writer."""
+        self._shutdown_logging()
+    
     def log_result(self, result: ExperimentResult):
         """Log a single experiment result."""
         self.results.append(result)
         
+        for totals in (self._overall_totals,
+                       self._framework_totals[result.framework],
+                       self._task_type_totals[result.task_type]):
+            totals['count'] += 1
+            for field in _SUMMARY_FIELDS:
+                totals[field] += getattr(result, field)
+        
         self.logger.info(
-            f"Framework: {result.framework}, Task: {result.task_id}, "
-            f"Run: {result.run_number}, Success: {result.success}, "
-            f"Score: {result.validation_score:.1f}, "
-            f"Time: {result.execution_time:.2f}s, "
-            f"Tokens: {result.tokens_used}"
+            "Framework: %s, Task: %s, Run: %s, Success: %s, Score: %.1f, Time: %.2fs, Tokens: %s",
+            result.framework, result.task_id, result.run_number, result.success,
+            result.validation_score, result.execution_time, result.tokens_used
         )
         
         if not result.success:
-            self.logger.error(f"Task failed: {result.error_message}")
+            self.logger.error("Task failed: %s", result.error_message)
         
         if not result.validation_passed:
-            self.logger.warning(f"Validation issues: {result.validation_issues}")
+            self.logger.warning("Validation issues: %s", result.validation_issues)
     
     def save_results_json(self, filename: Optional[str] = None):
         """Save all results to JSON file."""
@@ -87,12 +143,10 @@ class ExperimentLogger:
         
         filepath = self.results_dir / filename
         
-        results_data = [asdict(result) for result in self.results]
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results_data, f, indent=2, ensure_ascii=False)
+        # orjson serializes the dataclasses natively, so no asdict() copy is needed
+        filepath.write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
         
-        self.logger.info(f"Results saved to {filepath}")
+        self.logger.info("Results saved to %s", filepath)
         return filepath
     
     def save_results_csv(self, filename: Optional[str] = None):
@@ -102,16 +156,19 @@ class ExperimentLogger:
         
         filepath = self.results_dir / filename
         
-        # Convert to DataFrame and save
-        df = pd.DataFrame([asdict(result) for result in self.results])
+        # pandas is only needed here, so it is imported lazily to keep `import utils` fast
+        import pandas as pd
         
-        # Drop complex columns for CSV
-        columns_to_drop = ['intermediate_steps', 'validation_issues']
-        df_simple = df.drop(columns=[col for col in columns_to_drop if col in df.columns])
+        # Build tuple rows from the flat fields only, skipping the list columns instead of copying and dropping them
+        columns = [f.name for f in fields(ExperimentResult) if f.name not in _CSV_EXCLUDED_FIELDS]
+        df_simple = pd.DataFrame.from_records(
+            list(map(attrgetter(*columns), self.results)),
+            columns=columns
+        )
         
         df_simple.to_csv(filepath, index=False)
         
-        self.logger.info(f"CSV summary saved to {filepath}")
+        self.logger.info("CSV summary saved to %s", filepath)
         return filepath
     
     def generate_summary_stats(self) -> Dict[str, Any]:
@@ -119,40 +176,39 @@ class ExperimentLogger:
         if not self.results:
             return {}
         
-        df = pd.DataFrame([asdict(result) for result in self.results])
-        
+        overall = _averages(self._overall_totals)
         summary = {
             "total_experiments": len(self.results),
-            "success_rate": df['success'].mean(),
-            "avg_validation_score": df['validation_score'].mean(),
-            "avg_execution_time": df['execution_time'].mean(),
-            "avg_tokens_used": df['tokens_used'].mean(),
-            "avg_reasoning_steps": df['reasoning_steps'].mean(),
+            "success_rate": overall['success'],
+            "avg_validation_score": overall['validation_score'],
+            "avg_execution_time": overall['execution_time'],
+            "avg_tokens_used": overall['tokens_used'],
+            "avg_reasoning_steps": overall['reasoning_steps'],
         }
         
         # Framework-specific stats
         framework_stats = {}
-        for framework in df['framework'].unique():
-            framework_df = df[df['framework'] == framework]
+        for framework, totals in self._framework_totals.items():
+            averages = _averages(totals)
             framework_stats[framework] = {
-                "success_rate": framework_df['success'].mean(),
-                "avg_validation_score": framework_df['validation_score'].mean(),
-                "avg_execution_time": framework_df['execution_time'].mean(),
-                "avg_tokens_used": framework_df['tokens_used'].mean(),
-                "avg_reasoning_steps": framework_df['reasoning_steps'].mean(),
+                "success_rate": averages['success'],
+                "avg_validation_score": averages['validation_score'],
+                "avg_execution_time": averages['execution_time'],
+                "avg_tokens_used": averages['tokens_used'],
+                "avg_reasoning_steps": averages['reasoning_steps'],
             }
         
         summary["framework_stats"] = framework_stats
         
         # Task type stats
         task_type_stats = {}
-        for task_type in df['task_type'].unique():
-            task_df = df[df['task_type'] == task_type]
+        for task_type, totals in self._task_type_totals.items():
+            averages = _averages(totals)
             task_type_stats[task_type] = {
-                "success_rate": task_df['success'].mean(),
-                "avg_validation_score": task_df['validation_score'].mean(),
-                "avg_execution_time": task_df['execution_time'].mean(),
-                "avg_tokens_used": task_df['tokens_used'].mean(),
+                "success_rate": averages['success'],
+                "avg_validation_score": averages['validation_score'],
+                "avg_execution_time": averages['execution_time'],
+                "avg_tokens_used": averages['tokens_used'],
             }
         
         summary["task_type_stats"] = task_type_stats
@@ -168,10 +224,9 @@ class ExperimentLogger:
         
         summary = self.generate_summary_stats()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        filepath.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         
-        self.logger.info(f"Summary report saved to {filepath}")
+        self.logger.info("Summary report saved to %s", filepath)
         return filepath
     
     def print_summary(self):